@@ -4,7 +4,6 @@ CLEANUP ANALYSIS REPORTS
 Archives all but the most recent analysis reports (HTML and Markdown).
 """
 import os
-import glob
 import shutil
 from pathlib import Path
 
@@ -27,25 +26,28 @@ def cleanup_analysis_reports():
     print(f"📂 Archive directory is: {ARCHIVE_DIR}")
 
     # 2. Get all HTML and Markdown files in the reports directory
-    # We search directly in the REPORTS_DIR, not recursively, to avoid picking up archived files
-    html_files = glob.glob(str(REPORTS_DIR / '*.html'))
-    md_files = glob.glob(str(REPORTS_DIR / '*.md'))
-    all_files = html_files + md_files
+    # We scan only the REPORTS_DIR itself, not recursively, to avoid picking up archived files.
+    # A single scandir pass replaces one glob per extension, and each DirEntry caches its stat.
+    with os.scandir(REPORTS_DIR) as entries:
+        report_entries = [
+            entry for entry in entries
+            if entry.name.endswith(('.html', '.md')) and not entry.name.startswith('.')
+        ]
 
-    if not all_files:
+    if not report_entries:
         print("✅ No reports found to clean up.")
         return
 
     # 3. Find the most recent file
     try:
-        latest_file = max(all_files, key=os.path.getmtime)
-        print(f"✅ Keeping latest file: {os.path.basename(latest_file)}")
+        latest_entry = max(report_entries, key=lambda entry: entry.stat().st_mtime)
+        print(f"✅ Keeping latest file: {latest_entry.name}")
     except ValueError:
         print("✅ No reports found to clean up.")
         return
 
     # 4. Move all other files to the archive
-    files_to_move = [f for f in all_files if f != latest_file]
+    files_to_move = [entry.path for entry in report_entries if entry is not latest_entry]
     moved_count = 0
 
     if not files_to_move:
@@ -8,6 +8,11 @@ import os
 import numpy as np
 from pathlib import Path
 
+try:
+    import orjson  # Optional: much faster JSON parsing for large result files
+except ImportError:
+    orjson = None
+
 # Get the script's directory to build robust paths
 SCRIPT_DIR = Path(__file__).parent.resolve()
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -18,6 +23,31 @@ GROUND_TRUTH_PATHS = {
     'excel': PROJECT_ROOT / 'data/ground_truth/test_set_ground_truth_complete.xlsx'
 }
 
+# Allocation keys as used in model outputs ('hour_0' .. 'hour_23'), built once
+HOUR_KEYS = tuple(f'hour_{hour}' for hour in range(24))
+
+# Season and base complexity, indexed by meteorological season (Winter first)
+SEASON_COMPLEXITY = (
+    ('Winter', 3.0),
+    ('Spring', 2.0),
+    ('Summer', 1.0),
+    ('Autumn', 2.0)
+)
+
+def load_json_file(filepath):
+    """Load a JSON file, using orjson when available and the stdlib json otherwise"""
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity and integers beyond 64 bits, which the stdlib accepts
+            return json.loads(raw)
+    
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 def load_ground_truth():
     """Load optimal allocations generated by greedy algorithm for comparison"""
     print("\n" + "="*80)
@@ -27,8 +57,7 @@ def load_ground_truth():
     try:
         if os.path.exists(GROUND_TRUTH_PATHS['json']):
             print(f"✅ Loading ground truth from: {GROUND_TRUTH_PATHS['json']}")
-            with open(GROUND_TRUTH_PATHS['json'], 'r', encoding='utf-8') as f:
-                ground_truth = json.load(f)
+            ground_truth = load_json_file(GROUND_TRUTH_PATHS['json'])
             
             print(f"📈 Loaded {len(ground_truth)} ground truth scenarios")
             print("🎯 Ground truth contains optimal allocations from greedy algorithm")
@@ -37,18 +66,19 @@ def load_ground_truth():
             gt_lookup = {}
             for i, scenario in enumerate(ground_truth):
                 date = scenario['input']['date']
+                
+                # Extract optimal hourly allocations
+                optimal_allocations = {
+                    HOUR_KEYS[hour_result['hour']]: hour_result['ppfd_allocated']
+                    for hour_result in scenario['output']['hourly_results']
+                }
+                
                 gt_lookup[i] = {
                     'date': date,
                     'daily_total_required': scenario['input']['daily_total_ppfd_requirement'],
-                    'optimal_allocations': {},
+                    'optimal_allocations': optimal_allocations,
                     'scenario_complexity': calculate_scenario_complexity(scenario)
                 }
-                
-                # Extract optimal hourly allocations
-                for hour_result in scenario['output']['hourly_results']:
-                    hour = hour_result['hour']
-                    ppfd = hour_result['ppfd_allocated']
-                    gt_lookup[i]['optimal_allocations'][f'hour_{hour}'] = ppfd
             
             return gt_lookup
             
@@ -61,20 +91,9 @@ def calculate_scenario_complexity(scenario):
     ppfd_requirement = scenario['input']['daily_total_ppfd_requirement']
     date = scenario['input']['date']
     
-    # Parse date to determine season
+    # Parse date to determine season - (month % 12) // 3 maps Dec-Feb to 0, Mar-May to 1, ...
     month = int(date.split('-')[1])
-    if month in [12, 1, 2]:
-        season = 'Winter'
-        complexity_base = 3.0
-    elif month in [3, 4, 5]:
-        season = 'Spring'
-        complexity_base = 2.0
-    elif month in [6, 7, 8]:
-        season = 'Summer'
-        complexity_base = 1.0
-    else:
-        season = 'Autumn'
-        complexity_base = 2.0
+    season, complexity_base = SEASON_COMPLEXITY[(month % 12) // 3]
     
     # PPFD requirement complexity
     ppfd_complexity = min(ppfd_requirement / 2000, 3.0)  # Scale 0-3
@@ -96,41 +115,33 @@ def calculate_ground_truth_metrics(model_allocations, ground_truth, test_case_in
     gt_scenario = ground_truth[test_case_index]
     optimal_allocations = gt_scenario['optimal_allocations']
     
-    # Calculate comparison metrics
-    hourly_matches = []
+    # Calculate comparison metrics in a single pass over the hours
+    hourly_matches = 0
     absolute_errors = []
-    relative_errors = []
     
     total_model_ppfd = 0
     total_optimal_ppfd = sum(optimal_allocations.values())
     
-    for hour_key in optimal_allocations:
-        optimal_value = optimal_allocations[hour_key]
+    for hour_key, optimal_value in optimal_allocations.items():
         model_value = model_allocations.get(hour_key, 0)
-        
         total_model_ppfd += model_value
         
-        # Exact match check (within small tolerance for floating point)
-        is_exact_match = abs(model_value - optimal_value) < 0.01
-        hourly_matches.append(is_exact_match)
-        
-        # Calculate errors
         abs_error = abs(model_value - optimal_value)
         absolute_errors.append(abs_error)
         
-        if optimal_value > 0:
-            rel_error = abs_error / optimal_value * 100
-            relative_errors.append(rel_error)
+        # Exact match check (within small tolerance for floating point)
+        if abs_error < 0.01:
+            hourly_matches += 1
     
     # Daily total comparison
     daily_abs_error = abs(total_model_ppfd - total_optimal_ppfd)
     daily_rel_error = (daily_abs_error / total_optimal_ppfd * 100) if total_optimal_ppfd > 0 else 0
     
     return {
-        'exact_24h_match': sum(hourly_matches) == 24,
-        'hourly_matches': sum(hourly_matches),
-        'hourly_match_rate': sum(hourly_matches) / 24 * 100,
-        'mean_absolute_error': np.mean(absolute_errors),
+        'exact_24h_match': hourly_matches == 24,
+        'hourly_matches': hourly_matches,
+        'hourly_match_rate': hourly_matches / 24 * 100,
+        'mean_absolute_error': np.mean(absolute_errors) if absolute_errors else np.nan,  # NaN for an empty day, as before
         'daily_absolute_error': daily_abs_error,
         'daily_relative_error': daily_rel_error,
         'total_model_ppfd': total_model_ppfd,
@@ -11,39 +11,39 @@ import numpy as np
 from datetime import datetime
 import re
 from pathlib import Path
-from data_loader import calculate_ground_truth_metrics
+from data_loader import calculate_ground_truth_metrics, load_json_file
+
+# More specific patterns for different models - ordered by specificity
+MODEL_PARAMETER_MAP = {
+    # DeepSeek models - check most specific first
+    'deepseek-r1-0528': {'parameters': 671, 'architecture': 'MoE', 'type': 'Reasoning'},
+    'deepseek_deepseek-r1-0528': {'parameters': 671, 'architecture': 'MoE', 'type': 'Reasoning'},
+    'deepseek-r1-distill': {'parameters': 7, 'architecture': 'Dense', 'type': 'Distilled'},
+    'deepseek_deepseek-r1-distill': {'parameters': 7, 'architecture': 'Dense', 'type': 'Distilled'},
+
+    # Other models - exact patterns
+    'claude-3-7-sonnet': {'parameters': 200, 'architecture': 'Dense', 'type': 'Multi-modal'},
+    'anthropic_claude-3.7-sonnet': {'parameters': 200, 'architecture': 'Dense', 'type': 'Multi-modal'},
+    'llama-3.3-70b': {'parameters': 70, 'architecture': 'Dense', 'type': 'Instruction'},
+    'meta-llama_llama-3.3-70b': {'parameters': 70, 'architecture': 'Dense', 'type': 'Instruction'},
+    'mistral-7b': {'parameters': 7, 'architecture': 'Dense', 'type': 'Instruction'},
+    'mistralai_mistral-7b': {'parameters': 7, 'architecture': 'Dense', 'type': 'Instruction'},
+
+    # Generic fallbacks (less specific)
+    'claude': {'parameters': 200, 'architecture': 'Dense', 'type': 'Multi-modal'},
+    'llama': {'parameters': 70, 'architecture': 'Dense', 'type': 'Instruction'},
+    'mistral': {'parameters': 7, 'architecture': 'Dense', 'type': 'Instruction'},
+    'deepseek': {'parameters': 7, 'architecture': 'Dense', 'type': 'Distilled'},  # Fallback to smaller DeepSeek
+}
 
 def extract_model_parameters(model_name):
     """Extract model parameters from model name using pattern matching"""
     model_name_lower = model_name.lower()
     
-    # More specific patterns for different models - ordered by specificity
-    parameter_map = {
-        # DeepSeek models - check most specific first
-        'deepseek-r1-0528': {'parameters': 671, 'architecture': 'MoE', 'type': 'Reasoning'},
-        'deepseek_deepseek-r1-0528': {'parameters': 671, 'architecture': 'MoE', 'type': 'Reasoning'},
-        'deepseek-r1-distill': {'parameters': 7, 'architecture': 'Dense', 'type': 'Distilled'},
-        'deepseek_deepseek-r1-distill': {'parameters': 7, 'architecture': 'Dense', 'type': 'Distilled'},
-        
-        # Other models - exact patterns
-        'claude-3-7-sonnet': {'parameters': 200, 'architecture': 'Dense', 'type': 'Multi-modal'},
-        'anthropic_claude-3.7-sonnet': {'parameters': 200, 'architecture': 'Dense', 'type': 'Multi-modal'},
-        'llama-3.3-70b': {'parameters': 70, 'architecture': 'Dense', 'type': 'Instruction'},
-        'meta-llama_llama-3.3-70b': {'parameters': 70, 'architecture': 'Dense', 'type': 'Instruction'},
-        'mistral-7b': {'parameters': 7, 'architecture': 'Dense', 'type': 'Instruction'},
-        'mistralai_mistral-7b': {'parameters': 7, 'architecture': 'Dense', 'type': 'Instruction'},
-        
-        # Generic fallbacks (less specific)
-        'claude': {'parameters': 200, 'architecture': 'Dense', 'type': 'Multi-modal'},
-        'llama': {'parameters': 70, 'architecture': 'Dense', 'type': 'Instruction'},
-        'mistral': {'parameters': 7, 'architecture': 'Dense', 'type': 'Instruction'},
-        'deepseek': {'parameters': 7, 'architecture': 'Dense', 'type': 'Distilled'},  # Fallback to smaller DeepSeek
-    }
-    
     # Check for matches, most specific first
-    for pattern, params in parameter_map.items():
+    for pattern, params in MODEL_PARAMETER_MAP.items():
         if pattern in model_name_lower:
-            return params
+            return dict(params)  # Copy so each model's metrics own their parameter dict
     
     # Default fallback
     return {'parameters': 1, 'architecture': 'Unknown', 'type': 'Unknown'}
@@ -88,8 +88,7 @@ def analyze_single_model(filepath):
     model_name = os.path.basename(filepath).replace('.json', '').replace('results_', '')
     
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_file(filepath)
         
         # Basic metrics
         total_responses = len(data)
@@ -113,9 +112,7 @@ def analyze_single_model(filepath):
                     
                     # Extract hourly allocations for ground truth comparison
                     if 'allocation_PPFD_per_hour' in parsed_json:
-                        model_allocations = {}
-                        for hour_key, ppfd_value in parsed_json['allocation_PPFD_per_hour'].items():
-                            model_allocations[hour_key] = ppfd_value
+                        model_allocations = dict(parsed_json['allocation_PPFD_per_hour'])
                         
                         hourly_allocations.append(model_allocations)
                     
@@ -181,6 +178,11 @@ def process_ground_truth_comparison(metrics, ground_truth, hourly_allocations_li
     all_maes = []
     ground_truth_comparisons = []
     
+    # Aggregates are accumulated in the same pass - failure placeholders contribute nothing to them
+    exact_matches = 0
+    total_hourly_matches = 0
+    successful_maes = []
+    
     # We iterate up to the total number of scenarios tested
     for i in range(total_scenarios_tested):
         # Check if a valid, complete allocation exists for this scenario index
@@ -191,6 +193,10 @@ def process_ground_truth_comparison(metrics, ground_truth, hourly_allocations_li
             if comparison:
                 all_maes.append(comparison['daily_absolute_error'])
                 ground_truth_comparisons.append(comparison)
+                exact_matches += comparison['exact_24h_match']
+                total_hourly_matches += comparison['hourly_matches']
+                if comparison['daily_absolute_error'] < 10000.0:
+                    successful_maes.append(comparison['daily_absolute_error'])
         else:
             # This is a failure (API error, JSON error, or incomplete allocation)
             all_maes.append(10000.0)
@@ -205,10 +211,6 @@ def process_ground_truth_comparison(metrics, ground_truth, hourly_allocations_li
             ground_truth_comparisons.append(failure_comp)
     
     if ground_truth_comparisons:
-        # Calculate aggregate metrics from the full list of comparisons
-        exact_matches = sum(1 for comp in ground_truth_comparisons if comp['exact_24h_match'])
-        total_hourly_matches = sum(comp['hourly_matches'] for comp in ground_truth_comparisons)
-        
         # Calculate success rates based on TOTAL SCENARIOS TESTED
         total_possible_hourly_matches = total_scenarios_tested * 24
         
@@ -216,7 +218,6 @@ def process_ground_truth_comparison(metrics, ground_truth, hourly_allocations_li
         true_exact_match_rate = (exact_matches / total_scenarios_tested * 100) if total_scenarios_tested > 0 else 0
         
         # Mean Daily MAE should only be calculated over successful runs
-        successful_maes = [comp['daily_absolute_error'] for comp in ground_truth_comparisons if comp['daily_absolute_error'] < 10000.0]
         mean_daily_mae = np.mean(successful_maes) if successful_maes else float('inf')
 
         # The new Success-Weighted MAE is the mean of all MAEs (including penalties)
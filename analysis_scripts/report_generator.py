@@ -40,7 +40,7 @@ def format_model_analysis_section(metrics):
     params = metrics['model_parameters']['parameters']
     basic = metrics['basic_performance']
     
-    section = f"""
+    section_parts = [f"""
 ### {model_name} ({format_parameter_count(params)})
 
 **Basic Performance:**
@@ -48,25 +48,25 @@ def format_model_analysis_section(metrics):
 - JSON Validity Rate: {basic['json_success_rate']:.1f}%
 - Total Responses: {basic['total_responses']}
 
-"""
+"""]
     
     if metrics['ground_truth_analysis']:
         gt = metrics['ground_truth_analysis']
-        section += f"""**Ground Truth Analysis:**
+        section_parts.append(f"""**Ground Truth Analysis:**
 - Hourly Success Rate: {gt['mean_hourly_match_rate']:.1f}%
 - Exact 24h Matches: {gt['exact_24h_matches']}/{gt['total_scenarios_tested']} ({gt['exact_24h_match_rate']:.1f}%)
 - Mean Daily MAE: {gt['mean_daily_mae']:.2f} PPFD
 
-"""
+""")
     
-    section += f"""**Model Specifications:**
+    section_parts.append(f"""**Model Specifications:**
 - Parameters: {format_parameter_count(params)}
 - Type: {metrics['model_parameters']['type']}
 
 ---
-"""
+""")
     
-    return section
+    return "".join(section_parts)
 
 def generate_comprehensive_readme(all_metrics, stats_results, visualizations, timestamp):
     """Generate comprehensive README content"""
@@ -82,15 +82,15 @@ def generate_comprehensive_readme(all_metrics, stats_results, visualizations, ti
     
     num_models = len(all_metrics)
     
-    # Start README content
-    readme_content = f"""# 🔬 LED Optimization LLM Analysis Results
+    # Collect README sections and join once at the end instead of re-concatenating
+    readme_parts = [f"""# 🔬 LED Optimization LLM Analysis Results
 
 **Last Updated**: {timestamp}  
 **Analysis Status**: {num_models} models analyzed  
 **Statistical Analysis**: {'✅ Complete' if stats_results else '⚠️ Limited'}
-"""
+"""]
     
-    readme_content += """
+    readme_parts.append("""
 ## 🎯 Executive Summary
 
 This analysis evaluates Large Language Model performance on complex LED optimization tasks, revealing critical insights about the relationship between model scale and optimization capability.
@@ -104,7 +104,7 @@ This analysis evaluates Large Language Model performance on complex LED optimiza
 
 ## 📈 Performance Summary
 
-"""
+""")
     
     # Sort models by performance for ranking
     ranked_models = sorted(all_metrics, 
@@ -115,17 +115,13 @@ This analysis evaluates Large Language Model performance on complex LED optimiza
     # TRANSPOSED TABLE: Models as columns, metrics as rows
     model_names = [metrics['model_name'] for metrics in ranked_models]
     
-    # Create header with model names
-    header = "| **Metric** |"
-    for name in model_names:
-        # Use full model names instead of shortening them
-        header += f" **{name}** |"
-    header += "\n"
+    # Create header with model names - use full model names instead of shortening them
+    header = "| **Metric** |" + "".join(f" **{name}** |" for name in model_names) + "\n"
     
     # Create separator
     separator = "|" + "---|" * (len(model_names) + 1) + "\n"
     
-    readme_content += header + separator
+    readme_parts.append(header + separator)
     
     # Add each metric as a row
     metrics_rows = [
@@ -139,38 +135,30 @@ This analysis evaluates Large Language Model performance on complex LED optimiza
     ]
     
     for metric_name, values in metrics_rows:
-        row = f"| {metric_name} |"
-        for value in values:
-            row += f" {value} |"
-        row += "\n"
-        readme_content += row
+        readme_parts.append(f"| {metric_name} |" + "".join(f" {value} |" for value in values) + "\n")
     
     # Statistical insights
     if stats_results and 'insights' in stats_results:
-        readme_content += "\n## 📊 Statistical Insights\n\n"
+        readme_parts.append("\n## 📊 Statistical Insights\n\n")
         
         if stats_results['insights']['key_findings']:
-            readme_content += "### Key Statistical Findings\n"
-            for finding in stats_results['insights']['key_findings']:
-                readme_content += f"- {finding}\n"
+            readme_parts.append("### Key Statistical Findings\n")
+            readme_parts.extend(f"- {finding}\n" for finding in stats_results['insights']['key_findings'])
         
         if stats_results['insights']['limitations']:
-            readme_content += "\n### Limitations\n"
-            for limitation in stats_results['insights']['limitations']:
-                readme_content += f"- {limitation}\n"
+            readme_parts.append("\n### Limitations\n")
+            readme_parts.extend(f"- {limitation}\n" for limitation in stats_results['insights']['limitations'])
     
     # Add visualizations section
     if visualizations:
-        readme_content += "\n## 📊 Generated Visualizations\n\n"
+        readme_parts.append("\n## 📊 Generated Visualizations\n\n")
         for i, fig_path in enumerate(visualizations, 1):
             fig_name = os.path.basename(fig_path)
-            readme_content += f"- **Figure {i}**: {fig_name}\n"
+            readme_parts.append(f"- **Figure {i}**: {fig_name}\n")
     
     # Individual model analyses
-    readme_content += "\n## 🔍 Detailed Model Analysis\n"
-    
-    for metrics in ranked_models:
-        readme_content += format_model_analysis_section(metrics)
+    readme_parts.append("\n## 🔍 Detailed Model Analysis\n")
+    readme_parts.extend(format_model_analysis_section(metrics) for metrics in ranked_models)
     
     # Add methodology and conclusions
     methodology_and_conclusion = f"""
@@ -274,7 +262,8 @@ python run_analysis.py --monitor
 **Models Analyzed**: {num_models} models  
 **Total Test Cases**: 72 scenarios per model  
 """
-    readme_content += methodology_and_conclusion
+    readme_parts.append(methodology_and_conclusion)
+    readme_content = "".join(readme_parts)
     
     # Save README
     readme_path = "../README.md"
@@ -299,14 +288,10 @@ def generate_html_from_readme(readme_content, timestamp):
     """Generate HTML report from Markdown content and save it"""
     
     # Define output paths within the results directory
+    # (the timestamped README itself is already saved by generate_comprehensive_readme)
     report_dir = Path(RESULTS_DIRS['reports'])
-    readme_path = report_dir / f"README_{timestamp}.md"
     html_path = report_dir / f"analysis_report_{timestamp}.html"
 
-    print(f"📄 Saving analysis README to: {readme_path}")
-    with open(readme_path, 'w', encoding='utf-8') as f:
-        f.write(readme_content)
-
     print(f"📄 Saving HTML report to: {html_path}")
     # Convert markdown to HTML
     html_content = markdown.markdown(readme_content, extensions=['tables', 'fenced_code'])
@@ -133,14 +133,16 @@ def run_comprehensive_analysis():
             'generated_figures': visualizations,
             'summary': {
                 'total_models': len(all_metrics),
-                'models_with_ground_truth': len([m for m in all_metrics if m['ground_truth_analysis']]),
+                'models_with_ground_truth': sum(1 for m in all_metrics if m['ground_truth_analysis']),
                 'analysis_version': 'modular_v1.0'
             }
         }
         
         analysis_path = f"../results/analysis/comprehensive_analysis_{timestamp}.json"
+        # Encode in memory and hand the file a single write; json.dump would issue one
+        # small write per token of the indented output
         with open(analysis_path, 'w', encoding='utf-8') as f:
-            json.dump(analysis_data, f, indent=2, default=str)
+            f.write(json.dumps(analysis_data, indent=2, default=str))
         
         print(f"✅ Analysis data saved: {analysis_path}")
         
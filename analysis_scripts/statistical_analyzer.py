@@ -13,29 +13,37 @@ from sklearn.metrics import r2_score
 from sklearn.preprocessing import StandardScaler
 import warnings
 
-def bootstrap_correlation(x, y, n_bootstrap=1000):
+def bootstrap_correlation(x, y, n_bootstrap=1000, random_state=None):
     """Calculate bootstrap confidence intervals for correlations"""
-    correlations = []
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
     n = len(x)
     
-    for _ in range(n_bootstrap):
-        # Sample with replacement
-        indices = np.random.choice(n, n, replace=True)
-        x_boot = [x[i] for i in indices]
-        y_boot = [y[i] for i in indices]
-        
-        # Calculate correlation
-        if len(set(x_boot)) > 1 and len(set(y_boot)) > 1:  # Check for variation
-            corr, _ = pearsonr(x_boot, y_boot)
-            if not np.isnan(corr):
-                correlations.append(corr)
+    # Sample with replacement - draw the indices for every resample in one call
+    rng = np.random.default_rng(random_state)
+    boot_indices = rng.integers(0, n, size=(n_bootstrap, n))
+    
+    x_boot_all = x[boot_indices]
+    y_boot_all = y[boot_indices]
+    
+    # Check for variation in every resample at once - a constant resample has no correlation
+    has_variation = (np.ptp(x_boot_all, axis=1) > 0) & (np.ptp(y_boot_all, axis=1) > 0)
     
-    if correlations:
+    # Calculate the Pearson correlation of every remaining resample row-wise
+    x_centered = x_boot_all[has_variation] - x_boot_all[has_variation].mean(axis=1, keepdims=True)
+    y_centered = y_boot_all[has_variation] - y_boot_all[has_variation].mean(axis=1, keepdims=True)
+    x_centered /= np.linalg.norm(x_centered, axis=1, keepdims=True)
+    y_centered /= np.linalg.norm(y_centered, axis=1, keepdims=True)
+    correlations = np.clip(np.sum(x_centered * y_centered, axis=1), -1.0, 1.0)
+    correlations = correlations[~np.isnan(correlations)]
+    
+    if correlations.size:
+        ci_lower, ci_upper = np.percentile(correlations, [2.5, 97.5])  # One partition for both bounds
         return {
             'mean': np.mean(correlations),
             'std': np.std(correlations),
-            'ci_lower': np.percentile(correlations, 2.5),
-            'ci_upper': np.percentile(correlations, 97.5)
+            'ci_lower': ci_lower,
+            'ci_upper': ci_upper
         }
     else:
         return {'mean': 0, 'std': 0, 'ci_lower': 0, 'ci_upper': 0}
@@ -95,8 +103,9 @@ def comprehensive_statistical_analysis(all_metrics):
     summary_stats = df[numeric_cols].describe()
     results['summary_stats'] = summary_stats.to_dict()
     
+    # Report from the describe() output rather than recomputing mean/std per column
     for col in numeric_cols:
-        print(f"  {col}: μ={df[col].mean():.2f}, σ={df[col].std():.2f}")
+        print(f"  {col}: μ={summary_stats.at['mean', col]:.2f}, σ={summary_stats.at['std', col]:.2f}")
     
     # Correlation Analysis
     print("\n🔗 Correlation Analysis")
@@ -104,17 +113,19 @@ def comprehensive_statistical_analysis(all_metrics):
     
     # Parameter Count vs Performance Metrics
     perf_metrics = ['api_success_rate', 'json_success_rate', 'hourly_success_rate']
+    parameters = df['parameters'].to_numpy()  # Shared by every correlation and the regression
     
     for metric in perf_metrics:
-        if len(df[df[metric] > 0]) >= 2:  # Need at least 2 non-zero values
+        metric_values = df[metric].to_numpy()
+        if np.count_nonzero(metric_values > 0) >= 2:  # Need at least 2 non-zero values
             # Pearson correlation
-            r_pearson, p_pearson = pearsonr(df['parameters'], df[metric])
+            r_pearson, p_pearson = pearsonr(parameters, metric_values)
             
             # Spearman correlation (rank-based, more robust)
-            r_spearman, p_spearman = spearmanr(df['parameters'], df[metric])
+            r_spearman, p_spearman = spearmanr(parameters, metric_values)
             
             # Bootstrap confidence intervals
-            bootstrap_stats = bootstrap_correlation(df['parameters'].tolist(), df[metric].tolist())
+            bootstrap_stats = bootstrap_correlation(parameters, metric_values)
             
             correlations[f'parameters_vs_{metric}'] = {
                 'pearson_r': r_pearson,
@@ -137,8 +148,8 @@ def comprehensive_statistical_analysis(all_metrics):
     regression_results = {}
     
     # Focus on hourly success rate as primary outcome
-    if len(df[df['hourly_success_rate'] > 0]) >= 2:
-        X = df[['parameters']].values
+    if np.count_nonzero(df['hourly_success_rate'].to_numpy() > 0) >= 2:
+        X = parameters.reshape(-1, 1)
         y = df['hourly_success_rate'].values
         
         # Linear regression (existing)
@@ -200,12 +211,12 @@ def comprehensive_statistical_analysis(all_metrics):
     comparative_results = {}
     
     # Group models by architecture if we have multiple types
-    if len(df['architecture'].unique()) > 1:
-        arch_groups = {}
-        for arch in df['architecture'].unique():
-            arch_data = df[df['architecture'] == arch]['hourly_success_rate'].values
-            if len(arch_data) > 0:
-                arch_groups[arch] = arch_data
+    if df['architecture'].nunique() > 1:
+        # One groupby pass instead of a boolean mask per architecture (keeps first-seen order)
+        arch_groups = {
+            arch: group['hourly_success_rate'].values
+            for arch, group in df.groupby('architecture', sort=False)
+        }
         
         if len(arch_groups) >= 2:
             print(f"  Architecture Comparison: {list(arch_groups.keys())}")
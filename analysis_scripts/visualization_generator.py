@@ -20,6 +20,24 @@ RESULTS_DIRS = {
     'figures': PROJECT_ROOT / 'results/figures'
 }
 
+# Use EXACT mapping to avoid confusion - include prompt versions but exclude "improved" for Mistral
+MODEL_NAME_MAPPING = {
+    'deepseek-r1-0528-free': 'DeepSeek R1 V2 Prompt (671B)',
+    'deepseek-r1-distill-qwen-7b': 'DeepSeek R1 Distill Qwen V2 Prompt (7B)', 
+    'claude-3-7-sonnet': 'Claude 3.7 Sonnet V2 Prompt (200B)',
+    'llama-3.3-70b-instruct': 'Llama 3.3 70B Instruct V2 Prompt (70B)',
+    'mistral-7b-instruct': 'Mistral 7B Instruct V2 Prompt (7.3B)'
+}
+
+# Short names for the log-scale legend table, checked in order
+LEGEND_NAME_MAPPING = {
+    'deepseek-r1-0528': "DeepSeek-R1-0528",
+    'claude-3.7-sonnet': "Claude-3.7-Sonnet",
+    'llama-3.3-70b-instruct': "Llama-3.3-70B-Instruct",
+    'deepseek-r1-distill-qwen-7b': "DeepSeek-R1-Distill-Qwen-7B",
+    'mistral-7b-instruct': "Mistral-7B-Instruct"
+}
+
 def ensure_directories():
     """Create all required output directories"""
     for dir_path in RESULTS_DIRS.values():
@@ -48,23 +66,25 @@ def get_clean_model_name(model_name):
     """Get clean, consistent model names for visualization"""
     model_name_lower = model_name.lower()
     
-    # Use EXACT mapping to avoid confusion - include prompt versions but exclude "improved" for Mistral
-    name_mapping = {
-        'deepseek-r1-0528-free': 'DeepSeek R1 V2 Prompt (671B)',
-        'deepseek-r1-distill-qwen-7b': 'DeepSeek R1 Distill Qwen V2 Prompt (7B)', 
-        'claude-3-7-sonnet': 'Claude 3.7 Sonnet V2 Prompt (200B)',
-        'llama-3.3-70b-instruct': 'Llama 3.3 70B Instruct V2 Prompt (70B)',
-        'mistral-7b-instruct': 'Mistral 7B Instruct V2 Prompt (7.3B)'
-    }
-    
     # Check for exact matches first
-    for key, clean_name in name_mapping.items():
+    for key, clean_name in MODEL_NAME_MAPPING.items():
         if key in model_name_lower:
             return clean_name
     
     # Fallback to capitalize the original name
     return model_name.replace('_', ' ').replace('-', ' ').title()
 
+def get_legend_model_name(original_name, model_name):
+    """Get short model names for the log-scale legend table"""
+    original_name_lower = original_name.lower()
+    
+    for key, legend_name in LEGEND_NAME_MAPPING.items():
+        if key in original_name_lower:
+            return legend_name
+    
+    # Fallback to the clean plot name without the prompt version
+    return model_name.replace(' V2 Prompt', '').replace(' V1 Prompt', '').replace(' V0 Prompt', '')
+
 def format_parameter_count(params):
     """Format parameter count for display"""
     if params >= 1000:
@@ -87,7 +107,7 @@ def create_thesis_visualizations(all_metrics, stats_results, timestamp):
         print("❌ No metrics data available for visualization")
         return None
     
-    # Extract data for plotting
+    # Extract data for plotting - only the columns the plot functions consume
     plot_data = []
     for metrics in all_metrics:
         if metrics and metrics['model_parameters'] and metrics['basic_performance']:
@@ -96,17 +116,13 @@ def create_thesis_visualizations(all_metrics, stats_results, timestamp):
             
             model_info = {
                 'model_name': clean_name,  # Use clean name consistently
-                'original_name': metrics['model_name'],
+                'original_name': metrics['model_name'],  # Used by the log-scale legend table
                 'parameters': metrics['model_parameters']['parameters'],
-                'api_success_rate': metrics['basic_performance']['api_success_rate'],
-                'json_success_rate': metrics['basic_performance']['json_success_rate'],
-                'hourly_success_rate': 0,
-                'daily_mae': 0  # Add Daily MAE metric
+                'hourly_success_rate': 0
             }
             
             if metrics['ground_truth_analysis']:
                 model_info['hourly_success_rate'] = metrics['ground_truth_analysis']['mean_hourly_match_rate']
-                model_info['daily_mae'] = metrics['ground_truth_analysis']['mean_daily_mae']
             
             plot_data.append(model_info)
     
@@ -124,11 +140,10 @@ def create_thesis_visualizations(all_metrics, stats_results, timestamp):
     
     created_figures = []
     
-    # Figure 1: Scaling Law Analysis (Linear Scale)
-    if len(df[df['hourly_success_rate'] > 0]) >= 2:
-        fig1 = create_scaling_law_plot(df, timestamp)
-        if fig1:
-            created_figures.append(fig1)
+    # Figure 1: Scaling Law Analysis (Linear Scale) - the plot checks for enough data itself
+    fig1 = create_scaling_law_plot(df, timestamp)
+    if fig1:
+        created_figures.append(fig1)
     
     # Figure 1.1: Log-Scale Scaling Law (using computed regression from stats)
     if stats_results and 'regression_analysis' in stats_results:
@@ -141,34 +156,37 @@ def create_thesis_visualizations(all_metrics, stats_results, timestamp):
 def create_scaling_law_plot(df, timestamp):
     """Create scaling law plot with proper model annotations"""
     try:
-        fig, ax = plt.subplots(figsize=(12, 8))
-        
-        # Filter models with hourly success rate data
-        df_filtered = df[df['hourly_success_rate'] > 0].copy()
-        
-        if len(df_filtered) < 2:
+        # Bail out before allocating a figure or filtering when there is nothing to fit
+        if np.count_nonzero(df['hourly_success_rate'].to_numpy() > 0) < 2:
             print("⚠️  Insufficient data for scaling law plot")
             return None
         
+        fig, ax = plt.subplots(figsize=(12, 8))
+        
+        # Filter models with hourly success rate data (boolean indexing already returns a new frame)
+        df_filtered = df[df['hourly_success_rate'] > 0]
+        
         # Create scatter plot
         scatter = ax.scatter(df_filtered['parameters'], df_filtered['hourly_success_rate'],
                            s=200, alpha=0.7, c=range(len(df_filtered)), cmap='viridis')
         
         # Add model name annotations using smart positioning to avoid overlaps
         annotations = []
-        for i, (_, row) in enumerate(df_filtered.iterrows()):
+        param_values = df_filtered['parameters'].tolist()  # Built once, not per annotation
+        for i, (model_name, curr_params, success_rate) in enumerate(zip(df_filtered['model_name'].tolist(), 
+                                                                        param_values, 
+                                                                        df_filtered['hourly_success_rate'].tolist())):
             # Calculate smart positioning to avoid overlaps
             base_offset = (15, 15)  # Base offset
             # Stagger annotations vertically for models with similar parameters
             if i > 0:
                 # Check for similar parameter counts that might cause overlaps
-                prev_params = list(df_filtered['parameters'])[i-1]
-                curr_params = row['parameters']
+                prev_params = param_values[i-1]
                 if abs(np.log10(curr_params) - np.log10(prev_params)) < 0.3:  # Close in log space
                     base_offset = (15, 15 + (i % 3) * 25)  # Stagger vertically
             
-            annotation = ax.annotate(row['model_name'], 
-                       (row['parameters'], row['hourly_success_rate']),
+            annotation = ax.annotate(model_name, 
+                       (curr_params, success_rate),
                        xytext=base_offset, textcoords='offset points',
                        fontsize=10, ha='left',
                        bbox=dict(boxstyle='round,pad=0.3', facecolor='white', 
@@ -214,17 +232,18 @@ def create_log_scaling_law_plot(df, stats_results, timestamp):
             print("⚠️  No log-linear regression data available")
             return None
         
+        # Bail out before allocating a figure or sorting when there is nothing to fit
+        if np.count_nonzero(df['hourly_success_rate'].to_numpy() > 0) < 2:
+            print("⚠️  Insufficient data for log scaling law plot")
+            return None
+        
         log_reg_data = stats_results['regression_analysis']['hourly_success_rate']['log_linear']
         
         # Create figure with wider layout to accommodate legend table
         fig, (ax, legend_ax) = plt.subplots(1, 2, figsize=(16, 8), gridspec_kw={'width_ratios': [3, 1]})
         
         # Filter models with hourly success rate data and sort by PERFORMANCE (best to worst)
-        df_filtered = df[df['hourly_success_rate'] > 0].copy().sort_values('hourly_success_rate', ascending=False)
-        
-        if len(df_filtered) < 2:
-            print("⚠️  Insufficient data for log scaling law plot")
-            return None
+        df_filtered = df[df['hourly_success_rate'] > 0].sort_values('hourly_success_rate', ascending=False)
         
         # Create scatter plot with numbered points
         colors = plt.cm.viridis(np.linspace(0, 1, len(df_filtered)))
@@ -232,7 +251,8 @@ def create_log_scaling_law_plot(df, stats_results, timestamp):
                            s=250, alpha=0.8, c=colors, edgecolors='black', linewidth=2)
         
         # Add numbered annotations with better positioning to avoid overlaps
-        for i, (_, row) in enumerate(df_filtered.iterrows()):
+        for i, (params, success_rate) in enumerate(zip(df_filtered['parameters'].tolist(), 
+                                                       df_filtered['hourly_success_rate'].tolist())):
             # More sophisticated positioning to avoid all overlaps
             # Create offsets based on both performance and parameter values
             if i == 0:  # Best performer
@@ -247,16 +267,18 @@ def create_log_scaling_law_plot(df, stats_results, timestamp):
                 offset_x, offset_y = 8, -8
                 
             ax.annotate(f'{i+1}', 
-                       (row['parameters'], row['hourly_success_rate']),
+                       (params, success_rate),
                        ha='center', va='center', fontsize=13, fontweight='bold', 
                        color='white', 
                        bbox=dict(boxstyle='circle,pad=0.2', facecolor='black', alpha=0.9),
                        xytext=(offset_x, offset_y), textcoords='offset points')
         
         # Plot the log-linear regression line using computed coefficients
-        x_log_range = np.logspace(np.log10(df_filtered['parameters'].min()), 
-                                 np.log10(df_filtered['parameters'].max()), 100)
-        y_log_pred = log_reg_data['intercept'] + log_reg_data['coefficient'] * np.log10(x_log_range)
+        # Evaluate the fit on the log grid directly instead of taking log10 of a logspace
+        log_x_range = np.linspace(np.log10(df_filtered['parameters'].min()), 
+                                  np.log10(df_filtered['parameters'].max()), 100)
+        x_log_range = 10 ** log_x_range
+        y_log_pred = log_reg_data['intercept'] + log_reg_data['coefficient'] * log_x_range
         
         # Use academic color scheme - navy blue for regression line
         ax.plot(x_log_range, y_log_pred, color='#1f4e79', linestyle='-', alpha=0.9, linewidth=2.5, 
@@ -295,25 +317,13 @@ def create_log_scaling_law_plot(df, stats_results, timestamp):
         # Create clean legend table on the right
         legend_ax.axis('off')  # Remove axes
         
-        # Prepare clean model names for legend (use cleaner, shorter names)
-        legend_data = []
-        for i, (_, row) in enumerate(df_filtered.iterrows()):
-            # Map to cleaner model names
-            original_name_lower = row['original_name'].lower()
-            if 'deepseek-r1-0528' in original_name_lower:
-                clean_name = "DeepSeek-R1-0528"
-            elif 'claude-3.7-sonnet' in original_name_lower:
-                clean_name = "Claude-3.7-Sonnet"
-            elif 'llama-3.3-70b-instruct' in original_name_lower:
-                clean_name = "Llama-3.3-70B-Instruct"
-            elif 'deepseek-r1-distill-qwen-7b' in original_name_lower:
-                clean_name = "DeepSeek-R1-Distill-Qwen-7B"
-            elif 'mistral-7b-instruct' in original_name_lower:
-                clean_name = "Mistral-7B-Instruct"
-            else:
-                clean_name = row['model_name'].replace(' V2 Prompt', '').replace(' V1 Prompt', '').replace(' V0 Prompt', '')
-            
-            legend_data.append([f'{i+1}', clean_name, f"{row['parameters']:.0f}B", f"{row['hourly_success_rate']:.1f}%"])
+        # Prepare clean model names for legend (use cleaner, shorter names) straight from the columns
+        legend_data = [
+            [f'{i+1}', get_legend_model_name(original_name, model_name), f"{params:.0f}B", f"{rate:.1f}%"]
+            for i, (original_name, model_name, params, rate) in enumerate(zip(
+                df_filtered['original_name'], df_filtered['model_name'],
+                df_filtered['parameters'], df_filtered['hourly_success_rate']))
+        ]
         
         # Create legend table with better spacing
         legend_ax.text(0.05, 0.95, 'Model Legend', transform=legend_ax.transAxes, 